@@ -11,10 +11,12 @@
 # **************************************************************************** #
 
 import os
+import numpy as np
 import pandas as pd
 import cmocean.cm as cmo
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.colors as colors
 import matplotlib.dates as mdates
 from matplotlib.dates import DateFormatter
 
@@ -27,19 +29,16 @@ variables = ['AdvHTemp', 'ResT', 'AdvHZeta', 'Omega']
 
 for variable in variables:
     file = f'../ATMOS-BUD_Results/sample1_ERA5_track/{variable}.csv'
-    df = pd.read_csv(file, index_col=0)
-    df.columns = pd.to_datetime(df.columns)
-    df.columns = df.columns.strftime('%Y-%m-%d %H:%M')
+    df = pd.read_csv(file, index_col=0, dtype=np.float32, engine='c', memory_map=True)
+    df.columns = pd.to_datetime(df.columns, format='%Y-%m-%d %H:%M:%S')
     df.index = df.index/100
-
-    # Plot hovmollers
-    fig, ax = plt.subplots(figsize=(10, 5))
-    # Adjusts limits of colormap to max, min and zero
-    norm = colors.TwoSlopeNorm(vmin=df.to_numpy().min(), vcenter=0, vmax=df.to_numpy().max())
+    # Single float32 array passed straight to contourf
+    arr = df.to_numpy(dtype=np.float32)
 
     # plot hovmoller diagram
     fig, ax = plt.subplots(figsize=(10,10))
-    im = ax.contourf(df.columns, df.index, df.values, cmap=cmo.balance, levels=7)
+    im = ax.contourf(df.columns.values, df.index, arr, cmap=cmo.balance, levels=7,
+                     algorithm='serial')
     cbar = fig.colorbar(im)
 
     # invert y-axis
@@ -57,10 +56,7 @@ for variable in variables:
     # edit colorbar legend
     cbar.ax.tick_params(labelsize=10)
 
-    plt.savefig(figures_path + f'hovmoller_{variable}.png', dpi=300)
-
-figures_directory = "figures"
-os.makedirs(figures_directory, exist_ok=True)
-figure_path = os.path.join(figures_directory, f"hovmoller_{variable}.png")
-plt.savefig(figure_path)
-print(f"Figure saved to: {figure_path}")
+    figure_path = os.path.join(figures_path, f'hovmoller_{variable}.png')
+    fig.savefig(figure_path, dpi=300)
+    print(f"Figure saved to: {figure_path}")
+    plt.close(fig)
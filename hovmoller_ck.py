@@ -1,6 +1,9 @@
 import os
+import numpy as np
 import pandas as pd
 import cmocean.cm as cmo
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.dates as mdates
@@ -11,20 +14,24 @@ figures_path = 'figures/'
 os.makedirs(figures_path, exist_ok=True)
 
 file = "LEC_Akara-subset2_ERA5_track/results_vertical_levels/Ck_level.csv"
-df = pd.read_csv(file, index_col=0)
-df.index = pd.to_datetime(df.index)
+df = pd.read_csv(file, index_col=0, engine='c', memory_map=True)
+df.index = pd.to_datetime(df.index, format='%Y-%m-%d %H:%M:%S', cache=True)
 df.columns = df.columns.astype(float) / 100
 
 # Transpose the DataFrame for correct dimensions
 df = df.T
 
+# Single float32 array reused for colormap limits and contours
+arr = df.to_numpy(dtype=np.float32)
+
 # Plot hovmollers
 fig, ax = plt.subplots(figsize=(10, 10))
 
-norm = colors.TwoSlopeNorm(vmin=df.to_numpy().min(), vcenter=0, vmax=df.to_numpy().max())
+norm = colors.TwoSlopeNorm(vmin=arr.min(), vcenter=0, vmax=arr.max())
 
 # plot hovmoller diagram
-im = ax.contourf(df.columns, df.index, df, cmap=cmo.curl, levels=10, norm=norm, extend='both')
+im = ax.contourf(df.columns, df.index, arr, cmap=cmo.curl, levels=10, norm=norm, extend='both',
+                 algorithm='serial')
 cbar = fig.colorbar(im)
 
 # invert y-axis
@@ -44,5 +51,5 @@ cbar.ax.tick_params(labelsize=10)
 
 # Save the figure
 figure_path = os.path.join(figures_path, 'hovmoller_Ck.png')
-plt.savefig(figure_path, dpi=300)
+fig.savefig(figure_path, dpi=300)
 print(f"Figure saved to: {figure_path}")
@@ -16,6 +16,8 @@ This script will plot maps with the derivative of PV in y, as to display if baro
 
 import xarray as xr
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import pandas as pd
 import cartopy.crs as ccrs
@@ -77,16 +79,20 @@ pv_y_derivative = pv.diff('latitude')
 crs_longlat = ccrs.PlateCarree()
 land_feature = cfeature.NaturalEarthFeature('physical', 'land', '50m', edgecolor='face', facecolor=cfeature.COLORS['land'])
 
+# Select and sort the 300 hPa fields once, reused for every track time
+pv_300 = pv.sel(level=300).sortby(['latitude', 'longitude'])
+pv_y_derivative_300 = pv_y_derivative.sel(level=300).sortby(['latitude', 'longitude'])
+
 # Configure the plot for PV
 cmap_pv = cmo.balance
-pv_300_min = pv.sel(level=300).min().values / 5
-pv_300_max = pv.sel(level=300).max().values
+pv_300_min = pv_300.min().values / 5
+pv_300_max = pv_300.max().values
 norm_pv = colors.TwoSlopeNorm(vmin=pv_300_min, vcenter=0, vmax=pv_300_max)
 
 # Configure the plot for PV derivative
 cmap_pv_derivative = cmo.curl
-pv_derivative_300_min = pv_y_derivative.sel(level=300).min().values / 5
-pv_derivative_300_max = pv_y_derivative.sel(level=300).max().values
+pv_derivative_300_min = pv_y_derivative_300.min().values / 5
+pv_derivative_300_max = pv_y_derivative_300.max().values
 norm_derivative = colors.TwoSlopeNorm(vmin=pv_derivative_300_min, vcenter=0, vmax=pv_derivative_300_max)
 
 # Setting up the figure with different axes types
@@ -131,12 +137,10 @@ for i, (phase, row) in enumerate(periods.iterrows()):
         lon_min, lon_max = central_lon - width / 2, central_lon + width / 2
         
         # Slice the PV data at the central point
-        pv_300 = pv.sel(level=300).sortby(['latitude', 'longitude'])
         pv_slice = pv_300.sel(latitude=slice(lat_min, lat_max), longitude=slice(lon_min, lon_max), time=time)
         pv_slices.append(pv_slice.values)
 
         # Slice the PV derivative data at the central point
-        pv_y_derivative_300 = pv_y_derivative.sel(level=300).sortby(['latitude', 'longitude'])
         pv_y_derivative_slice = pv_y_derivative_300.sel(latitude=slice(lat_min, lat_max), longitude=slice(lon_min, lon_max), time=time)
         pv_y_derivative_slices.append(pv_y_derivative_slice.values)
 
@@ -153,12 +157,12 @@ for i, (phase, row) in enumerate(periods.iterrows()):
     # Main PV plot
     cf = ax_pv.contourf(composite_x, composite_y, pv_phase_mean, cmap=cmap_pv, transform=crs_longlat)
     ax_pv.set_title(phase)
-    plt.colorbar(cf, ax=ax_pv, pad=0.1, orientation='horizontal', shrink=0.5)
+    fig.colorbar(cf, ax=ax_pv, pad=0.1, orientation='horizontal', shrink=0.5)
 
     # Derivative of PV plot
     cf = ax_pv_derivative.contourf(composite_x, composite_y, pv_y_derivative_mean, cmap=cmap_pv_derivative, transform=crs_longlat)
     ax_pv_derivative.set_title(r'$\frac{\partial PV}{\partial y}$')
-    plt.colorbar(cf, ax=ax_pv_derivative, pad=0.1, orientation='horizontal', shrink=0.5)
+    fig.colorbar(cf, ax=ax_pv_derivative, pad=0.1, orientation='horizontal', shrink=0.5)
 
     # Longitudinal average of PV derivative plot
     ax_pv_derivative_long_mean.plot(pv_y_derivative_long_mean, np.arange(len(pv_y_derivative_long_mean)), color='#003049', linewidth=3)
@@ -166,7 +170,7 @@ for i, (phase, row) in enumerate(periods.iterrows()):
     ax_pv_derivative_long_mean.set_title(r'$\frac{\partial PV}{\partial y}$ Longitudinal Average')
 
 # Adjust layout
-plt.tight_layout()
-plt.savefig('figures/barotropic_instability.png')
+fig.tight_layout()
+fig.savefig('figures/barotropic_instability.png')
 print('Done!')
 
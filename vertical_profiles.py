@@ -14,6 +14,8 @@
 import os
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import matplotlib.colors as colors
@@ -46,5 +48,6 @@ for variable in variables:
     ax.invert_yaxis()
     ax.set_ylabel('Pressure [hPa]')
     ax.title.set_text(f'{variable}')
-    plt.legend()
-    plt.savefig(figures_path + f'vertical_profile_{variable}.png', dpi=300)
\ No newline at end of file
+    ax.legend()
+    fig.savefig(figures_path + f'vertical_profile_{variable}.png', dpi=300)
+    plt.close(fig)
\ No newline at end of file